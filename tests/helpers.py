@@ -0,0 +1,49 @@
+import random
+
+from virtpet.pet import Pet
+
+
+# -----------------------------
+# Per-minute Reference
+# -----------------------------
+
+def reference_tick(pet: Pet, minutes: int) -> None:
+    """
+    The original minute-by-minute tick rules.
+    Pet.tick advances in closed form and must match this exactly.
+    """
+    if pet.paused or pet.state.value == "sleeping":
+        return
+
+    for _ in range(minutes):
+        pet.age += 1
+        pet._hunger_timer += 1
+        pet._toilet_timer += 1
+        pet._happiness_timer += 1
+
+        if pet._hunger_timer >= Pet.HUNGER_INTERVAL:
+            pet.hunger = min(100, pet.hunger + 1)
+            pet._hunger_timer = 0
+
+        if pet._toilet_timer >= Pet.TOILET_INTERVAL:
+            pet.toilet = min(100, pet.toilet + 1)
+            pet._toilet_timer = 0
+
+        if pet._happiness_timer >= Pet.HAPPINESS_INTERVAL:
+            if pet.hunger >= Pet.CRITICAL_NEED or pet.toilet >= Pet.CRITICAL_NEED:
+                pet.happiness = max(0, pet.happiness - 5)
+            else:
+                pet.happiness = max(0, pet.happiness - 1)
+            pet._happiness_timer = 0
+
+
+def random_pet(rng: random.Random) -> Pet:
+    pet = Pet("ref")
+    pet.age = rng.randint(0, 10_000)
+    pet.hunger = rng.randint(0, 100)
+    pet.happiness = rng.randint(0, 100)
+    pet.toilet = rng.randint(0, 100)
+    pet._hunger_timer = rng.randrange(Pet.HUNGER_INTERVAL)
+    pet._toilet_timer = rng.randrange(Pet.TOILET_INTERVAL)
+    pet._happiness_timer = rng.randrange(Pet.HAPPINESS_INTERVAL)
+    return pet
@@ -0,0 +1,125 @@
+import pytest
+
+from virtpet.checkpoints import CheckpointRing
+from virtpet.engine import GameEngine
+from virtpet.pet import Pet, PetState
+
+
+def make_engine(interval=60, capacity=48):
+    engine = GameEngine(Pet("timeline"), persist=False)
+    engine.enable_checkpoints(interval, capacity)
+    return engine
+
+
+def pet_at(age):
+    pet = Pet("reference")
+    pet.tick(age)
+    return pet
+
+
+# -----------------------------
+# Checkpoint Ring
+# -----------------------------
+
+def test_ring_rejects_empty_configuration():
+    with pytest.raises(ValueError):
+        CheckpointRing(interval=0)
+    with pytest.raises(ValueError):
+        CheckpointRing(capacity=0)
+
+
+def test_ring_wraps_around_and_evicts_oldest():
+    engine = make_engine(interval=60, capacity=3)
+    engine._advance(600)
+
+    ring = engine.checkpoints
+    assert ring.ages() == [480, 540, 600]
+    assert ring.get(420) is None
+    assert ring.get(480) == pet_at(480).snapshot()
+
+
+# -----------------------------
+# Rewind
+# -----------------------------
+
+def test_rewind_lands_on_exact_minute():
+    engine = make_engine()
+    engine._advance(300)
+
+    engine.rewind(155)
+
+    assert engine.pet.snapshot() == pet_at(155).snapshot()
+
+
+def test_rewind_past_oldest_checkpoint_rejected():
+    engine = make_engine(interval=60, capacity=3)
+    engine._advance(600)
+
+    with pytest.raises(ValueError, match="No checkpoint"):
+        engine.rewind(479)
+    with pytest.raises(ValueError, match="forward"):
+        engine.rewind(601)
+
+    assert engine.pet.age == 600
+
+
+def test_abandoned_future_stays_invisible():
+    engine = make_engine(interval=60, capacity=10)
+    engine._advance(300)
+    abandoned = engine.checkpoints.get(240)
+
+    engine.rewind(130)
+
+    assert engine.checkpoints.ages() == [0, 60, 120]
+    assert engine.checkpoints.get(180) is None
+    with pytest.raises(ValueError):
+        engine.rewind(200)
+
+    # The new timeline overwrites the abandoned slots
+    engine.feed()
+    engine._advance(170)
+    assert engine.checkpoints.ages() == [0, 60, 120, 180, 240, 300]
+    assert engine.checkpoints.get(240) != abandoned
+
+
+def test_rewind_keeps_pause_and_sleep():
+    engine = make_engine()
+    engine._advance(200)
+
+    engine.toggle_pause()
+    engine.rewind(130)
+    assert engine.pet.age == 130
+    assert engine.pet.paused
+
+    engine.toggle_pause()
+    engine.toggle_sleep()
+    engine.rewind(70)
+    assert engine.pet.age == 70
+    assert engine.pet.state == PetState.SLEEPING
+    assert not engine.pet.paused
+
+
+# -----------------------------
+# Fork
+# -----------------------------
+
+def test_fork_is_isolated_from_parent():
+    engine = make_engine()
+    engine._advance(300)
+    parent_snapshot = engine.pet.snapshot()
+    parent_ages = engine.checkpoints.ages()
+
+    fork = engine.fork(150)
+    assert fork.pet.snapshot() == pet_at(150).snapshot()
+    assert not fork.persist
+
+    fork.feed()
+    fork._advance(500)
+    fork.rewind(400)
+
+    assert engine.pet.snapshot() == parent_snapshot
+    assert engine.checkpoints.ages() == parent_ages
+
+    # The parent can still rewind into its own future
+    engine.rewind(290)
+    assert engine.pet.snapshot() == pet_at(290).snapshot()
@@ -0,0 +1,63 @@
+import pytest
+
+from virtpet.game import run_batch
+from virtpet.persistence import load_pet
+from virtpet.pet import Pet
+
+
+@pytest.fixture
+def save_path(tmp_path):
+    return tmp_path / "pet.json"
+
+
+# -----------------------------
+# Tests
+# -----------------------------
+
+@pytest.mark.parametrize(
+    "command, minutes",
+    [("wait 15", 15), ("wait 90m", 90), ("wait 2h", 120), ("wait 1d", 1440), ("WAIT  3 h", 180)],
+)
+def test_wait_units(save_path, command, minutes):
+    pet = Pet("batch")
+    result = run_batch(pet, [command], path=save_path)
+
+    assert result.minutes == minutes
+    assert pet.age == minutes
+    assert result.unknown == 0
+
+
+def test_unknown_command_consumes_one_minute(save_path):
+    pet = Pet("batch")
+    result = run_batch(pet, ["dance", "feed", "sing"], path=save_path)
+
+    assert result.commands == 3
+    assert result.unknown == 2
+    assert result.minutes == 3
+
+
+def test_comments_blanks_and_quit(save_path):
+    pet = Pet("batch")
+    result = run_batch(pet, ["# morning", "", "feed", "quit", "wait 1d"], path=save_path)
+
+    assert result.commands == 1
+    assert result.minutes == 1
+
+
+@pytest.mark.parametrize("checkpoint_every, saves", [(None, 1), (1, 2), (2, 1), (5, 1)])
+def test_checkpoint_and_final_save_count(save_path, checkpoint_every, saves):
+    pet = Pet("batch")
+    result = run_batch(pet, ["feed", "wait 30m"], checkpoint_every, path=save_path)
+
+    assert result.saves == saves
+    assert result.minutes == 31
+    assert load_pet(save_path).snapshot()[:4] == pet.snapshot()[:4]
+
+
+def test_minutes_count_only_time_the_pet_aged(save_path):
+    pet = Pet("batch")
+    result = run_batch(pet, ["feed", "sleep", "wait 2h", "sleep", "wait 10"], path=save_path)
+
+    # Feeding and waking each use a minute; time stops while asleep
+    assert result.minutes == 12
+    assert pet.age == 12
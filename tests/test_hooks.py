@@ -0,0 +1,104 @@
+import time
+
+import pytest
+
+from virtpet.hooks import (
+    ACTION_APPLIED,
+    SAVED,
+    TICK_ADVANCED,
+    ActionApplied,
+    HookBus,
+    Saved,
+    TickAdvanced,
+)
+
+
+# -----------------------------
+# Tests
+# -----------------------------
+
+def test_inactive_until_subscribed():
+    bus = HookBus()
+    assert not bus.active
+
+    bus.subscribe(SAVED, print)
+    assert bus.active
+
+    bus.unsubscribe(SAVED, print)
+    assert not bus.active
+
+
+def test_unknown_event_rejected():
+    with pytest.raises(ValueError, match="Unknown hook event"):
+        HookBus().subscribe("exploded", print)
+
+
+def test_one_tuple_per_event_type_per_dispatch():
+    bus = HookBus()
+    ticks, actions = [], []
+    bus.subscribe(TICK_ADVANCED, ticks.append)
+    bus.subscribe(ACTION_APPLIED, actions.append)
+
+    bus.emit(TICK_ADVANCED, TickAdvanced(1, 1))
+    bus.emit(ACTION_APPLIED, ActionApplied("feed", 1))
+    bus.emit(TICK_ADVANCED, TickAdvanced(2, 3))
+    bus.emit(SAVED, Saved(3))  # no subscriber: dropped
+    bus.dispatch()
+
+    assert ticks == [(TickAdvanced(1, 1), TickAdvanced(2, 3))]
+    assert actions == [(ActionApplied("feed", 1),)]
+
+    # Nothing queued: no empty batches
+    bus.dispatch()
+    assert len(ticks) == 1 and len(actions) == 1
+
+
+def test_overrun_reported_once():
+    bus = HookBus(time_budget=0.001)
+
+    def slow(batch):
+        time.sleep(0.005)
+
+    bus.subscribe(SAVED, slow, name="slowpoke")
+
+    reports = []
+    for age in range(3):
+        bus.emit(SAVED, Saved(age))
+        reports += bus.dispatch()
+
+    assert len(reports) == 1
+    assert "slowpoke" in reports[0]
+    assert bus.overruns == {"slowpoke": 3}
+
+
+def test_failing_plugin_does_not_affect_others():
+    bus = HookBus()
+    received = []
+
+    def broken(batch):
+        raise RuntimeError("boom")
+
+    bus.subscribe(SAVED, broken, name="broken")
+    bus.subscribe(SAVED, received.append)
+
+    reports = []
+    for age in range(2):
+        bus.emit(SAVED, Saved(age))
+        reports += bus.dispatch()
+
+    assert received == [(Saved(0),), (Saved(1),)]
+    assert reports == ["[PLUGIN] broken failed on saved: boom"]
+    assert bus.errors == {"broken": 2}
+
+
+def test_unsubscribe_discards_queued_events():
+    bus = HookBus()
+    received = []
+    bus.subscribe(SAVED, received.append)
+
+    bus.emit(SAVED, Saved(1))
+    bus.unsubscribe(SAVED, received.append)
+    bus.subscribe(SAVED, received.append)
+    bus.dispatch()
+
+    assert received == []
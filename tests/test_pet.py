@@ -0,0 +1,26 @@
+import random
+
+import pytest
+
+from helpers import random_pet, reference_tick
+from virtpet.pet import Pet
+
+
+# -----------------------------
+# Tests
+# -----------------------------
+
+@pytest.mark.parametrize("seed", range(5))
+def test_tick_matches_per_minute_reference(seed):
+    rng = random.Random(seed)
+
+    for _ in range(400):
+        pet = random_pet(rng)
+        reference = Pet("ref")
+        reference.restore(pet.snapshot())
+
+        for _ in range(4):
+            minutes = rng.choice([0, 1, 29, 30, 59, 60, 61, 119, 120, rng.randint(0, 3000)])
+            pet.tick(minutes)
+            reference_tick(reference, minutes)
+            assert pet.snapshot() == reference.snapshot()
@@ -0,0 +1,101 @@
+import os
+import time
+import uuid
+
+import pytest
+
+from virtpet.pet import Pet, PetState
+from virtpet.shared_state import (
+    _HEARTBEAT,
+    _HEARTBEAT_OFFSET,
+    STALE_AFTER,
+    SharedStatePublisher,
+    SharedStateViewer,
+)
+
+
+@pytest.fixture
+def publisher():
+    publisher = SharedStatePublisher(f"vpet-test-{os.getpid()}-{uuid.uuid4().hex[:8]}")
+    yield publisher
+    if publisher._buf is not None:
+        publisher.close()
+
+
+@pytest.fixture
+def pet():
+    pet = Pet("Mochi")
+    pet.age = 321
+    pet.hunger = 42
+    pet.happiness = 77
+    pet.toilet = 13
+    pet.state = PetState.SLEEPING
+    return pet
+
+
+def poll_until(publisher, count, timeout=1.0):
+    commands = []
+    deadline = time.monotonic() + timeout
+    while len(commands) < count and time.monotonic() < deadline:
+        commands += publisher.poll_commands()
+    return commands
+
+
+# -----------------------------
+# Tests
+# -----------------------------
+
+def test_round_trip(publisher, pet):
+    publisher.publish(pet, ["fed", "played"])
+    viewer = SharedStateViewer(publisher.name)
+
+    try:
+        assert viewer.running
+        assert viewer.pet.snapshot()[:4] == (321, 42, 77, 13)
+        assert viewer.pet.name == "Mochi"
+        assert viewer.pet.state == PetState.SLEEPING
+        assert viewer.events == ["fed", "played"]
+
+        pet.hunger = 5
+        publisher.publish(pet, ["fed"])
+        viewer.sync()
+        assert viewer.pet.hunger == 5
+        assert viewer.events == ["fed"]
+
+        viewer.feed()
+        viewer._send("pause")
+        viewer._send("dance")
+        assert poll_until(publisher, 2) == ["feed", "pause"]
+    finally:
+        viewer.close()
+
+
+def test_stale_heartbeat_stops_viewer(publisher, pet):
+    publisher.publish(pet, [])
+    viewer = SharedStateViewer(publisher.name)
+
+    try:
+        _HEARTBEAT.pack_into(publisher._buf, _HEARTBEAT_OFFSET, time.time() - STALE_AFTER - 1)
+        viewer.sync()
+        assert not viewer.running
+    finally:
+        viewer.close()
+
+
+def test_closed_segment_stops_viewer(publisher, pet):
+    publisher.publish(pet, [])
+    viewer = SharedStateViewer(publisher.name)
+
+    try:
+        publisher.close()
+        viewer.sync()
+        assert not viewer.running
+    finally:
+        viewer.close()
+
+
+def test_rejects_foreign_segment(publisher):
+    publisher._buf[0:4] = b"NOPE"
+
+    with pytest.raises(ValueError):
+        SharedStateViewer(publisher.name)
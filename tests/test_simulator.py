@@ -0,0 +1,53 @@
+import pytest
+
+from virtpet.simulator import CarePolicy, run_simulation
+
+
+def test_parse_full_policy():
+    policy = CarePolicy.parse("feed when hunger > 60, flush at toilet 40, play every 3h")
+
+    assert policy.feed_above_hunger == 60
+    assert policy.flush_at_toilet == 40
+    assert policy.play_every_minutes == 180
+
+
+def test_parse_disables_unmentioned_rules_and_accepts_minutes():
+    policy = CarePolicy.parse("Play every 45m")
+
+    assert policy.feed_above_hunger is None
+    assert policy.flush_at_toilet is None
+    assert policy.play_every_minutes == 45
+
+
+def test_parse_rejects_unknown_rule():
+    with pytest.raises(ValueError, match="Unknown care rule"):
+        CarePolicy.parse("feed when hunger > 60, dance at midnight")
+
+
+def test_negative_jitter_rejected():
+    with pytest.raises(ValueError, match="reaction_jitter"):
+        CarePolicy.parse("flush at toilet 40", reaction_jitter=-1)
+
+
+@pytest.mark.parametrize("lifetimes, days", [(0, 1), (1, 0)])
+def test_run_simulation_rejects_empty_runs(lifetimes, days):
+    with pytest.raises(ValueError):
+        run_simulation(CarePolicy(), lifetimes=lifetimes, days=days, workers=1)
+
+
+def test_results_independent_of_worker_count():
+    policy = CarePolicy(reaction_jitter=30)
+
+    serial = run_simulation(policy, lifetimes=6, days=1, seed=3, workers=1)
+    parallel = run_simulation(policy, lifetimes=6, days=1, seed=3, workers=2)
+
+    assert serial.outcomes == parallel.outcomes
+
+
+def test_different_seeds_give_different_samples():
+    policy = CarePolicy(reaction_jitter=30)
+
+    first = run_simulation(policy, lifetimes=4, days=2, seed=1, workers=1)
+    second = run_simulation(policy, lifetimes=4, days=2, seed=2, workers=1)
+
+    assert first.outcomes != second.outcomes
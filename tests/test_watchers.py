@@ -0,0 +1,153 @@
+import random
+
+import pytest
+
+from helpers import random_pet, reference_tick
+from virtpet.engine import GameEngine
+from virtpet.pet import Pet
+
+
+# -----------------------------
+# Prediction
+# -----------------------------
+
+@pytest.mark.parametrize("stat", ["hunger", "toilet", "happiness"])
+def test_minutes_until_matches_per_minute_reference(stat):
+    rng = random.Random(stat)
+
+    for _ in range(200):
+        pet = random_pet(rng)
+        threshold = rng.randint(-1, 101)
+
+        reference = Pet("ref")
+        reference.restore(pet.snapshot())
+
+        def met() -> bool:
+            value = getattr(reference, stat)
+            return value <= threshold if stat == "happiness" else value >= threshold
+
+        # Every need saturates within ~12,000 minutes
+        expected = None
+        for minute in range(15_000):
+            if met():
+                expected = minute
+                break
+            reference_tick(reference, 1)
+
+        assert pet.minutes_until(stat, threshold) == expected
+
+
+# -----------------------------
+# Engine Integration
+# -----------------------------
+
+def make_engine() -> GameEngine:
+    return GameEngine(Pet("watched"), persist=False)
+
+
+def recorder(fired: list):
+    def callback(watcher, pet):
+        fired.append((watcher.condition, pet.age, pet.hunger, pet.happiness, pet.toilet))
+    return callback
+
+
+def test_advance_fires_at_exact_due_age():
+    engine = make_engine()
+    fired = []
+
+    # Hunger starts at 50 and rises every 30 minutes: 52 is reached at minute 60
+    watcher = engine.watch("hunger >= 52", recorder(fired))
+    assert watcher.due_age == 60
+
+    engine._advance(500)
+
+    # Happiness also decays once at minute 60
+    assert fired == [("hunger >= 52", 60, 52, 49, 0)]
+    assert engine.pet.age == 500
+
+
+def test_watcher_fires_immediately_if_already_met():
+    engine = make_engine()
+    fired = []
+
+    engine.watch("hunger >= 50", recorder(fired))
+
+    assert [f[1] for f in fired] == [0]
+
+
+def test_no_refire_while_condition_holds():
+    engine = make_engine()
+    fired = []
+
+    engine.watch("hunger > 50", recorder(fired))
+    engine._advance(100)
+    engine._advance(1000)
+
+    assert len(fired) == 1
+
+
+def test_feed_rearms_watcher():
+    engine = make_engine()
+    fired = []
+
+    engine.watch("hunger >= 52", recorder(fired))
+    engine._advance(60)
+    assert len(fired) == 1
+
+    # Feeding drops hunger to 32: the watcher is re-armed for 20 steps later
+    engine.feed()
+    assert len(fired) == 1
+
+    engine._advance(20 * Pet.HUNGER_INTERVAL)
+
+    assert [f[1] for f in fired] == [60, 60 + 20 * Pet.HUNGER_INTERVAL]
+
+
+def test_play_rearms_happiness_watcher():
+    engine = make_engine()
+    fired = []
+
+    # Keep hunger far from critical so decay stays at 1 per hour
+    engine.pet.hunger = 0
+    engine.watch("happiness <= 49", recorder(fired))
+    engine._advance(60)
+    assert [f[1] for f in fired] == [60]
+
+    # Play lifts happiness to 64; it takes 15 more hourly decays to reach 49
+    engine.play()
+    engine._advance(15 * Pet.HAPPINESS_INTERVAL)
+
+    assert [f[1] for f in fired] == [60, 60 + 15 * Pet.HAPPINESS_INTERVAL]
+
+
+def test_flush_rearms_and_play_can_fire_immediately():
+    engine = make_engine()
+    fired = []
+
+    engine.watch("toilet >= 2", recorder(fired))
+
+    # Play adds 2 toilet: the condition becomes true through an action
+    engine.play()
+    assert [f[1] for f in fired] == [0]
+
+    engine.flush()
+    engine._advance(2 * Pet.TOILET_INTERVAL)
+
+    assert [f[1] for f in fired] == [0, 2 * Pet.TOILET_INTERVAL]
+
+
+def test_unwatch_stops_callbacks():
+    engine = make_engine()
+    fired = []
+
+    watcher = engine.watch("hunger >= 52", recorder(fired))
+    engine.unwatch(watcher)
+    engine._advance(500)
+
+    assert fired == []
+
+
+@pytest.mark.parametrize("condition", ["hunger <= 10", "happiness >= 90", "energy >= 1", "hunger"])
+def test_unsupported_conditions_rejected(condition):
+    with pytest.raises(ValueError):
+        make_engine().watch(condition, lambda watcher, pet: None)
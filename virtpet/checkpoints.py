@@ -0,0 +1,96 @@
+from typing import Optional
+
+from virtpet.pet import Pet
+
+
+class CheckpointRing:
+    """
+    Bounded ring of pet snapshots taken every `interval` ticked minutes.
+
+    Checkpoints sit at ages that are multiples of the interval, so the
+    slot for any age is computed directly and lookups are O(1). Snapshots
+    are immutable tuples of small ints (see Pet.snapshot), so a slot
+    costs a couple hundred bytes and slots can be shared between forks
+    without copying.
+
+    Only the most recent `capacity` checkpoints are kept.
+    """
+
+    def __init__(self, interval: int = 60, capacity: int = 48):
+        if interval < 1 or capacity < 1:
+            raise ValueError("Checkpoint interval and capacity must be positive")
+
+        self.interval: int = interval
+        self.capacity: int = capacity
+
+        # Slot -> (age, snapshot)
+        self._slots: list[Optional[tuple[int, tuple]]] = [None] * capacity
+
+        # Age of the newest valid checkpoint. Anything later belongs to an
+        # abandoned timeline (after a rewind) and is ignored until overwritten.
+        self._newest: Optional[int] = None
+
+    # -----------------------------
+    # Recording
+    # -----------------------------
+
+    def minutes_until_next(self, age: int) -> int:
+        """
+        Ticked minutes from `age` until the next checkpoint age.
+        """
+        return self.interval - age % self.interval
+
+    def observe(self, pet: Pet) -> None:
+        """
+        Record a checkpoint if the pet sits exactly on a checkpoint age.
+        """
+        if pet.age % self.interval == 0:
+            self._slots[(pet.age // self.interval) % self.capacity] = (pet.age, pet.snapshot())
+            self._newest = pet.age
+
+    # -----------------------------
+    # Lookup
+    # -----------------------------
+
+    def get(self, age: int) -> Optional[tuple]:
+        """
+        Snapshot taken at exactly `age`, or None if unavailable.
+        """
+        if self._newest is None or age % self.interval or not self._is_live(age):
+            return None
+
+        entry = self._slots[(age // self.interval) % self.capacity]
+        if entry is None or entry[0] != age:
+            return None
+        return entry[1]
+
+    def latest_at_or_before(self, age: int) -> Optional[int]:
+        """
+        Age of the checkpoint a rewind to `age` would start from.
+        """
+        checkpoint_age = age - age % self.interval
+        return checkpoint_age if self.get(checkpoint_age) is not None else None
+
+    def ages(self) -> list[int]:
+        """
+        Ages of all live checkpoints, oldest first.
+        """
+        return sorted(
+            entry[0] for entry in self._slots
+            if entry is not None and self._is_live(entry[0])
+        )
+
+    def truncate(self, age: int) -> None:
+        """
+        Forget checkpoints newer than `age` (the timeline branches here).
+        """
+        self._newest = age
+
+    def copy(self) -> "CheckpointRing":
+        ring = CheckpointRing(self.interval, self.capacity)
+        ring._slots = list(self._slots)
+        ring._newest = self._newest
+        return ring
+
+    def _is_live(self, age: int) -> bool:
+        return self._newest - self.interval * self.capacity < age <= self._newest
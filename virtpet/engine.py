@@ -1,6 +1,22 @@
 import time
+from typing import Callable, Optional
 from virtpet.pet import Pet
 from virtpet.persistence import save_pet
+from virtpet.checkpoints import CheckpointRing
+from virtpet.watchers import Watcher, WatcherSet
+from virtpet.hooks import (
+    ACTION_APPLIED,
+    REWOUND,
+    SAVED,
+    STATE_CHANGED,
+    TICK_ADVANCED,
+    ActionApplied,
+    HookBus,
+    Rewound,
+    Saved,
+    StateChanged,
+    TickAdvanced,
+)
 from collections import deque
 from datetime import datetime, timedelta
 
@@ -26,10 +42,16 @@ class GameEngine:
     # Construction & Configuration
     # -----------------------------
 
-    def __init__(self, pet: Pet, minutes_per_real_second: float = 1.0):
+    def __init__(
+        self,
+        pet: Pet,
+        minutes_per_real_second: float = 1.0,
+        persist: bool = True,
+    ):
         """
         :param pet: The Pet instance being simulated
         :param minutes_per_real_second: How many in-game minutes pass per real second
+        :param persist: Save the pet after each advancement (off for forks)
         """
         # Core domain object
         self.pet: Pet = pet
@@ -37,12 +59,27 @@ class GameEngine:
         # Time scaling factor
         self.minutes_per_real_second: float = minutes_per_real_second
 
+        # Persistence control
+        self.persist: bool = persist
+
         # Main loop control flag
         self.running: bool = True
 
         #logs
         self.events = deque(maxlen=5)
 
+        # Threshold watchers (see watch())
+        self._watchers = WatcherSet()
+
+        # Shared memory publisher for read-only viewers (see share())
+        self._publisher = None
+
+        # Extension hooks, delivered in batches once per loop iteration
+        self.hooks: HookBus = HookBus()
+
+        # In-memory rewind points (see enable_checkpoints())
+        self.checkpoints: Optional[CheckpointRing] = None
+
         # -----------------------------
         # Internal time tracking
         # -----------------------------
@@ -66,10 +103,15 @@ class GameEngine:
         - Converts it to in-game time
         - Advances the pet in whole-minute steps
         - Persists state after each advancement
+        - Delivers queued hook events to plugins
         """
         while self.running:
             self._update_sleep_state()
             self._update_time()
+            if self.hooks.active:
+                self._dispatch_hooks()
+            if self._publisher is not None:
+                self._serve_viewers()
             time.sleep(0.05)
 
     # -----------------------------
@@ -80,12 +122,17 @@ class GameEngine:
     SLEEP_START_HOUR = 22  # 10 PM
     SLEEP_END_HOUR = 6  # 6 AM
 
-    def _is_sleep_time(self) -> bool:
-        now = datetime.now()
-        hour = now.hour
-
+    @classmethod
+    def is_sleep_hour(cls, hour: int) -> bool:
+        """
+        Return True if the given hour (0–23) falls inside the sleep window.
+        """
         # Night crosses midnight
-        return hour >= self.SLEEP_START_HOUR or hour < self.SLEEP_END_HOUR
+        return hour >= cls.SLEEP_START_HOUR or hour < cls.SLEEP_END_HOUR
+
+    @classmethod
+    def _is_sleep_time(cls) -> bool:
+        return cls.is_sleep_hour(datetime.now().hour)
 
     def _update_time(self) -> None:
         """
@@ -105,11 +152,210 @@ class GameEngine:
         whole_minutes = int(self._accumulated_minutes)
 
         if whole_minutes > 0:
-            self.pet.tick(whole_minutes)
+            age_before = self.pet.age
+            self._advance(whole_minutes)
             self._accumulated_minutes -= whole_minutes
 
             # Persist after state changes
-            save_pet(self.pet)
+            if self.persist:
+                save_pet(self.pet)
+
+            if self.hooks.active:
+                if self.pet.age != age_before:
+                    self.hooks.emit(
+                        TICK_ADVANCED, TickAdvanced(self.pet.age - age_before, self.pet.age)
+                    )
+                if self.persist:
+                    self.hooks.emit(SAVED, Saved(self.pet.age))
+
+    def _advance(self, minutes: int) -> None:
+        """
+        Tick the pet, stopping at each watcher due time and checkpoint
+        age so callbacks and snapshots see the pet at the exact minute.
+        """
+        if not self._watchers and self.checkpoints is None:
+            self.pet.tick(minutes)
+            return
+
+        while minutes > 0:
+            step = minutes
+
+            until_due = self._watchers.minutes_until_due(self.pet.age)
+            if until_due is not None:
+                step = min(step, max(1, until_due))
+
+            if self.checkpoints is not None:
+                step = min(step, self.checkpoints.minutes_until_next(self.pet.age))
+
+            age_before = self.pet.age
+            self.pet.tick(step)
+            minutes -= step
+
+            # Sleeping or paused: time is frozen, nothing can come due
+            if self.pet.age == age_before:
+                return
+
+            self._watchers.fire_due(self.pet)
+            if self.checkpoints is not None:
+                self.checkpoints.observe(self.pet)
+
+    # -----------------------------
+    # Checkpoints
+    # -----------------------------
+
+    def enable_checkpoints(self, interval: int = 60, capacity: int = 48) -> None:
+        """
+        Keep a snapshot every `interval` in-game minutes of pet age,
+        retaining the last `capacity` (default: hourly for two days).
+        """
+        self.checkpoints = CheckpointRing(interval, capacity)
+
+        # Only record states that tick() can advance from
+        if not self.pet.paused and self.pet.state != self.pet.state.SLEEPING:
+            self.checkpoints.observe(self.pet)
+
+    def rewind(self, age: int) -> None:
+        """
+        Return the pet to an exact age (in ticked minutes).
+
+        Restores the latest checkpoint at or before `age`, then ticks
+        forward the remaining minutes (always less than one interval).
+        Checkpoints after `age` are discarded: the timeline branches here.
+
+        :raises ValueError: If `age` is in the future or not covered by a checkpoint
+        """
+        if self.checkpoints is None:
+            raise RuntimeError("Checkpoints are not enabled")
+
+        if age > self.pet.age:
+            raise ValueError(
+                f"Cannot rewind forward to minute {age} (pet is at minute {self.pet.age})"
+            )
+
+        checkpoint_age = self.checkpoints.latest_at_or_before(age)
+        if checkpoint_age is None:
+            raise ValueError(f"No checkpoint available for minute {age}")
+
+        # Sleep and pause are the player's current choices, not history:
+        # keep them across the rewind so only the in-game minute moves
+        old_age = self.pet.age
+        state, paused = self.pet.state, self.pet.paused
+
+        self.pet.restore(self.checkpoints.get(checkpoint_age))
+        self.checkpoints.truncate(checkpoint_age)
+
+        # Checkpoints are only taken awake and unpaused, so re-advance as such
+        self.pet.state, self.pet.paused = state.IDLE, False
+        self.pet.tick(age - checkpoint_age)
+        self.pet.state, self.pet.paused = state, paused
+
+        if self.pet.age != age:
+            raise RuntimeError(f"Rewind to minute {age} ended at minute {self.pet.age}")
+
+        self._watchers.replan(self.pet)
+        if self.hooks.active:
+            self.hooks.emit(REWOUND, Rewound(old_age, self.pet.age))
+        self.log(f"[TIME] Rewound {self.pet.name} to minute {self.pet.age}.")
+
+    def fork(self, age: Optional[int] = None) -> "GameEngine":
+        """
+        Create an independent engine for a what-if branch.
+
+        The fork starts from the current state, or from `age` if given,
+        shares no mutable state with this engine and never saves to disk.
+        Watchers, hooks and viewers are not carried over.
+        """
+        pet = Pet(self.pet.name)
+        pet.restore(self.pet.snapshot())
+
+        fork = GameEngine(pet, self.minutes_per_real_second, persist=False)
+
+        if self.checkpoints is not None:
+            fork.checkpoints = self.checkpoints.copy()
+            if age is not None:
+                fork.rewind(age)
+        elif age is not None:
+            raise RuntimeError("Checkpoints are not enabled")
+
+        return fork
+
+    # -----------------------------
+    # Viewer Sharing
+    # -----------------------------
+
+    def share(self, name: str) -> None:
+        """
+        Publish pet state into a named shared memory segment so other
+        processes can attach read-only (see SharedStateViewer).
+        """
+        from virtpet.shared_state import SharedStatePublisher
+
+        self._publisher = SharedStatePublisher(name)
+        self._publisher.publish(self.pet, self.events)
+
+    def stop_sharing(self) -> None:
+        if self._publisher is not None:
+            self._publisher.close()
+            self._publisher = None
+
+    def sync(self) -> None:
+        """
+        Called by the UI once per frame. Viewers refresh their snapshot
+        from shared memory here; the engine owns the pet, so there is
+        nothing to do.
+        """
+
+    def _serve_viewers(self) -> None:
+        """
+        Apply commands sent by viewers, then publish the current state.
+        """
+        actions = {
+            "feed": self.feed,
+            "play": self.play,
+            "flush": self.flush,
+            "sleep": self.toggle_sleep,
+            "pause": self.toggle_pause,
+        }
+        for command in self._publisher.poll_commands():
+            actions[command]()
+
+        self._publisher.publish(self.pet, self.events)
+
+    # -----------------------------
+    # Watchers
+    # -----------------------------
+
+    def watch(self, condition: str, callback: Callable[[Watcher, Pet], None]) -> Watcher:
+        """
+        Subscribe to a pet condition, e.g. "hunger >= 80", "toilet >= 60"
+        or "happiness <= 10".
+
+        The engine predicts the in-game minute the condition will be met
+        and calls callback(watcher, pet) only then. Fires immediately if
+        the condition already holds.
+        """
+        watcher = Watcher(condition, callback)
+        self._watchers.add(watcher, self.pet)
+        return watcher
+
+    def unwatch(self, watcher: Watcher) -> None:
+        self._watchers.remove(watcher)
+
+    # -----------------------------
+    # Hooks
+    # -----------------------------
+
+    def _dispatch_hooks(self) -> None:
+        for report in self.hooks.dispatch():
+            self.log(report)
+
+    def _emit_action(self, action: str) -> None:
+        if self.hooks.active:
+            self.hooks.emit(ACTION_APPLIED, ActionApplied(action, self.pet.age))
+
+    def _emit_state_change(self, field: str, old: object, new: object) -> None:
+        if self.hooks.active:
+            self.hooks.emit(STATE_CHANGED, StateChanged(field, old, new, self.pet.age))
 
     def log(self, message: str) -> None:
         """
@@ -124,15 +370,22 @@ class GameEngine:
         if self.pet.state != self.pet.state.IDLE:
             return
         self.pet.feed()
+        self._watchers.replan(self.pet)
+        self._emit_action("feed")
         self.log(f"[CARE] You fed {self.pet.name}.")
 
     def flush(self) -> None:
         self.pet.flush()
+        self._watchers.replan(self.pet)
+        self._emit_action("flush")
         self.log(f"[HYGIENE] You cleaned up after {self.pet.name}.")
 
     def toggle_sleep(self) -> None:
-        was_sleeping = self.pet.state == self.pet.state.SLEEPING
+        old_state = self.pet.state
+        was_sleeping = old_state == old_state.SLEEPING
         self.pet.sleep()
+        self._emit_action("sleep")
+        self._emit_state_change("state", old_state, self.pet.state)
         if was_sleeping:
             self.log(f"[REST] You woke {self.pet.name} up.")
         else:
@@ -140,6 +393,8 @@ class GameEngine:
 
     def play(self):
         self.pet.play()
+        self._watchers.replan(self.pet)
+        self._emit_action("play")
         self.log(f"[PLAY] You played with {self.pet.name}.")
 
     #pause button
@@ -153,6 +408,8 @@ class GameEngine:
         by skipping tick() calls.
         """
         self.pet.paused = not self.pet.paused
+        self._emit_action("pause")
+        self._emit_state_change("paused", not self.pet.paused, self.pet.paused)
 
     def _update_sleep_state(self) -> None:
         """
@@ -160,22 +417,28 @@ class GameEngine:
         """
         should_sleep = self._is_sleep_time()
 
-        if should_sleep and self.pet.state != self.pet.state.SLEEPING:
+        old_state = self.pet.state
+
+        if should_sleep and old_state != old_state.SLEEPING:
             self.pet.sleep()
             self.log(f"[REST] {self.pet.name} fell asleep.")
+            self._emit_state_change("state", old_state, self.pet.state)
 
-        elif not should_sleep and self.pet.state == self.pet.state.SLEEPING:
+        elif not should_sleep and old_state == old_state.SLEEPING:
             self.pet.sleep()
             self.log(f"[REST] {self.pet.name} woke up.")
+            self._emit_state_change("state", old_state, self.pet.state)
 
-    def get_local_time(self) -> str:
+    @staticmethod
+    def get_local_time() -> str:
         """
         Return the user's local time as HH:MM.
         """
         now = datetime.now()
         return now.strftime("%H:%M")
 
-    def get_time_to_next_sleep_transition(self) -> str:
+    @classmethod
+    def get_time_to_next_sleep_transition(cls) -> str:
         """
         Return a human-readable countdown until the next sleep or wake transition.
         Examples:
@@ -184,13 +447,13 @@ class GameEngine:
         """
         now = datetime.now()
 
-        if self._is_sleep_time():
+        if cls._is_sleep_time():
             # Sleeping → count until wake
-            target_hour = self.SLEEP_END_HOUR
+            target_hour = cls.SLEEP_END_HOUR
             label = "Wakes in"
         else:
             # Awake → count until sleep
-            target_hour = self.SLEEP_START_HOUR
+            target_hour = cls.SLEEP_START_HOUR
             label = "Sleeps in"
 
         target_time = now.replace(
@@ -1,6 +1,13 @@
-import json
+import argparse
+import re
+import sys
+import time
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable, Optional
+
 from virtpet.pet import Pet
+from virtpet.persistence import load_pet, save_pet
 
 
 def show_status(pet: Pet):
@@ -11,25 +18,25 @@ def show_status(pet: Pet):
     print("\n--- STATUS ---")
     print(f"Name: {pet.name}")
     print(f"Age: {pet.age}")
+    print(f"State: {pet.state.value}")
     print(f"Hunger: {pet.hunger}")
-    print(f"Energy: {pet.energy}")
     print(f"Happiness: {pet.happiness}")
-
-SAVE_FILE = Path("pet_save.json")
+    print(f"Toilet: {pet.toilet}")
 
 
-def load_pet() -> Pet:
+def load_or_create_pet(path: Optional[Path] = None, name: Optional[str] = None) -> Pet:
     """
     Load pet from disk if it exists, otherwise create a new one.
+    Prompts for a name unless one is given.
     """
-    if SAVE_FILE.exists():
-        with open(SAVE_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+    pet = load_pet(path)
+    if pet is not None:
         print("A familiar presence awakens...")
-        return Pet.from_dict(data)
+        return pet
 
     print("A new egg appears...")
-    name = input("Give it a name: ").strip()
+    if name is None:
+        name = input("Give it a name: ").strip()
 
     if not name:
         name = "Basilisk-chan"
@@ -37,20 +44,12 @@ def load_pet() -> Pet:
     return Pet(name)
 
 
-def save_pet(pet: Pet):
-    """
-    Persist the pet's current state to disk.
-    """
-    with open(SAVE_FILE, "w", encoding="utf-8") as f:
-        json.dump(pet.to_dict(), f, indent=2)
-
-
 def run():
     """
     Main game loop.
     Owns the pet instance and controls time progression.
     """
-    pet = load_pet()
+    pet = load_or_create_pet()
 
     while True:
         show_status(pet)
@@ -75,3 +74,142 @@ def run():
         # Time always moves forward
         pet.tick()
         save_pet(pet)
+
+
+# -----------------------------
+# Batch Mode
+# -----------------------------
+
+# Commands that map directly to a player action
+BATCH_ACTIONS = {
+    "feed": Pet.feed,
+    "play": Pet.play,
+    "sleep": Pet.sleep,
+    "flush": Pet.flush,
+}
+
+# "wait 90m", "wait 2h", "wait 1d", "wait 15" (minutes)
+_WAIT_RE = re.compile(r"wait\s+(\d+)\s*([mhd]?)")
+_WAIT_UNITS = {"": 1, "m": 1, "h": 60, "d": 24 * 60}
+
+
+@dataclass
+class BatchResult:
+    """
+    Summary of a batch run.
+    """
+
+    commands: int = 0
+    unknown: int = 0
+
+    # In-game minutes the pet actually aged (sleep and pause stop the clock)
+    minutes: int = 0
+    saves: int = 0
+
+
+def run_batch(
+    pet: Pet,
+    lines: Iterable[str],
+    checkpoint_every: Optional[int] = None,
+    path: Optional[Path] = None,
+) -> BatchResult:
+    """
+    Apply a stream of commands to a pet in memory.
+
+    Time follows the interactive loop: every command consumes one
+    in-game minute (unknown ones included) and "wait N" consumes N.
+    Elapsed minutes are accumulated and applied with a single tick()
+    right before the next action, so runs of waits cost one tick.
+
+    Blank lines and lines starting with '#' are ignored; "quit" stops.
+    The pet is saved every ``checkpoint_every`` commands and at the end.
+    """
+    result = BatchResult()
+    pending = 0
+    started_age = pet.age
+
+    # Whether the pet changed since the last checkpoint save
+    dirty = False
+
+    for line in lines:
+        command = line.strip().lower()
+        if not command or command[0] == "#":
+            continue
+        if command == "quit":
+            break
+
+        result.commands += 1
+        dirty = True
+        action = BATCH_ACTIONS.get(command)
+
+        if action is not None:
+            if pending:
+                pet.tick(pending)
+            action(pet)
+            pending = 1
+        elif match := _WAIT_RE.fullmatch(command):
+            pending += int(match.group(1)) * _WAIT_UNITS[match.group(2)]
+        else:
+            result.unknown += 1
+            pending += 1
+
+        if checkpoint_every and result.commands % checkpoint_every == 0:
+            pet.tick(pending)
+            pending = 0
+            save_pet(pet, path)
+            result.saves += 1
+            dirty = False
+
+    # Skip the final save if a checkpoint just wrote this exact state
+    if dirty or not result.saves:
+        pet.tick(pending)
+        save_pet(pet, path)
+        result.saves += 1
+
+    result.minutes = pet.age - started_age
+    return result
+
+
+def main() -> None:
+    """
+    Run the interactive loop, or a batch of commands with --batch.
+    """
+    parser = argparse.ArgumentParser(description="Line-oriented virtual pet")
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="read commands from FILE ('-' for stdin) instead of prompting",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=int,
+        metavar="N",
+        help="in batch mode, also save every N commands",
+    )
+    parser.add_argument("--name", help="name for a new pet (batch mode)")
+    args = parser.parse_args()
+
+    if args.batch is None:
+        run()
+        return
+
+    pet = load_or_create_pet(name=args.name or "")
+
+    started = time.perf_counter()
+    if args.batch == "-":
+        result = run_batch(pet, sys.stdin, args.checkpoint)
+    else:
+        with open(args.batch, "r", encoding="utf-8") as file:
+            result = run_batch(pet, file, args.checkpoint)
+    elapsed = time.perf_counter() - started
+
+    show_status(pet)
+    print("\n--- BATCH ---")
+    print(f"Commands: {result.commands} ({result.unknown} not understood)")
+    print(f"Time advanced: {result.minutes} min")
+    print(f"Saves: {result.saves}")
+    print(f"Elapsed: {elapsed:.3f}s ({result.commands / max(elapsed, 1e-9):,.0f} commands/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Union
+
+
+# -----------------------------
+# Hook Events
+# -----------------------------
+
+TICK_ADVANCED = "tick_advanced"
+ACTION_APPLIED = "action_applied"
+STATE_CHANGED = "state_changed"
+SAVED = "saved"
+REWOUND = "rewound"
+
+EVENTS = (TICK_ADVANCED, ACTION_APPLIED, STATE_CHANGED, SAVED, REWOUND)
+
+
+@dataclass(frozen=True)
+class TickAdvanced:
+    """
+    The pet was advanced by a number of in-game minutes.
+    """
+
+    minutes: int
+    age: int
+
+
+@dataclass(frozen=True)
+class ActionApplied:
+    """
+    A player action changed the pet ("feed", "play", "flush", ...).
+    """
+
+    action: str
+    age: int
+
+
+@dataclass(frozen=True)
+class StateChanged:
+    """
+    The pet's activity state or pause flag changed.
+    """
+
+    field: str
+    old: object
+    new: object
+    age: int
+
+
+@dataclass(frozen=True)
+class Saved:
+    """
+    The pet was persisted.
+    """
+
+    age: int
+
+
+@dataclass(frozen=True)
+class Rewound:
+    """
+    The pet was rewound to an earlier checkpointed minute.
+    """
+
+    from_age: int
+    to_age: int
+
+
+HookPayload = Union[TickAdvanced, ActionApplied, StateChanged, Saved, Rewound]
+HookCallback = Callable[[tuple], None]
+
+
+# -----------------------------
+# Hook Bus
+# -----------------------------
+
+class HookBus:
+    """
+    Batched publish/subscribe for engine extensions.
+
+    The engine emits events as they happen; subscribers receive them
+    as one tuple per event type, once per engine iteration. Batches and
+    payloads are immutable, so plugins cannot affect each other. With
+    no subscribers, `active` is False and the engine skips emitting
+    altogether.
+
+    Each callback is timed. One that runs longer than `time_budget`
+    seconds, or raises, is reported once through the engine log and
+    counted in `overruns` / `errors`.
+    """
+
+    def __init__(self, time_budget: float = 0.005):
+        self.time_budget: float = time_budget
+
+        # True while anyone is subscribed; checked by the engine before emitting
+        self.active: bool = False
+
+        self._subscribers: dict[str, list[tuple[str, HookCallback]]] = {
+            event: [] for event in EVENTS
+        }
+        self._pending: dict[str, list[HookPayload]] = {event: [] for event in EVENTS}
+
+        # Actions arrive from the UI thread while the engine dispatches
+        self._lock = threading.Lock()
+
+        # Plugin name -> number of budget overruns / exceptions
+        self.overruns: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+
+    # -----------------------------
+    # Subscription
+    # -----------------------------
+
+    def subscribe(self, event: str, callback: HookCallback, name: str = "") -> None:
+        """
+        Register callback(batch) for an event type.
+
+        :param name: Plugin name used in reports (defaults to the callback's name)
+        """
+        if event not in self._subscribers:
+            raise ValueError(f"Unknown hook event: {event!r}")
+
+        name = name or getattr(callback, "__qualname__", repr(callback))
+        self._subscribers[event].append((name, callback))
+        self.active = True
+
+    def unsubscribe(self, event: str, callback: HookCallback) -> None:
+        """
+        Remove callback from an event type. Events still queued for a
+        type nobody listens to anymore are discarded.
+        """
+        with self._lock:
+            self._subscribers[event] = [
+                (name, cb) for name, cb in self._subscribers[event] if cb != callback
+            ]
+            if not self._subscribers[event]:
+                self._pending[event] = []
+            self.active = any(self._subscribers.values())
+
+    # -----------------------------
+    # Emission & Dispatch
+    # -----------------------------
+
+    def emit(self, event: str, payload: HookPayload) -> None:
+        """
+        Queue an event for the next dispatch.
+        Events without subscribers are dropped.
+        """
+        if not self._subscribers[event]:
+            return
+
+        with self._lock:
+            self._pending[event].append(payload)
+
+    def dispatch(self) -> list[str]:
+        """
+        Deliver queued events, one batch per event type and subscriber.
+
+        :return: Report messages for plugins that misbehaved for the first time
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = {event: [] for event in EVENTS}
+
+        reports: list[str] = []
+
+        for event, queued in pending.items():
+            if not queued:
+                continue
+
+            batch = tuple(queued)
+
+            for name, callback in self._subscribers[event]:
+                started = time.perf_counter()
+                try:
+                    callback(batch)
+                except Exception as error:
+                    self.errors[name] = self.errors.get(name, 0) + 1
+                    if self.errors[name] == 1:
+                        reports.append(f"[PLUGIN] {name} failed on {event}: {error}")
+                    continue
+
+                elapsed = time.perf_counter() - started
+                if elapsed > self.time_budget:
+                    self.overruns[name] = self.overruns.get(name, 0) + 1
+                    if self.overruns[name] == 1:
+                        reports.append(
+                            f"[PLUGIN] {name} took {elapsed * 1000:.1f}ms "
+                            f"on {event} (budget {self.time_budget * 1000:.1f}ms)"
+                        )
+
+        return reports
@@ -1,9 +1,12 @@
+import argparse
+import sys
 import threading
 
 from virtpet.pet import Pet
 from virtpet.engine import GameEngine
 from virtpet.ui_curses import CursesUI
 from virtpet.persistence import load_pet
+from virtpet.shared_state import SharedStateViewer
 
 
 # -----------------------------
@@ -26,7 +29,7 @@ def create_pet() -> Pet:
     return Pet(name)
 
 
-def start_engine(engine: GameEngine) -> None:
+def start_engine(engine: GameEngine) -> threading.Thread:
     """
     Start the game engine in a background thread.
     """
@@ -35,6 +38,43 @@ def start_engine(engine: GameEngine) -> None:
         daemon=True
     )
     engine_thread.start()
+    return engine_thread
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Real-time terminal virtual pet")
+    parser.add_argument(
+        "--share",
+        metavar="NAME",
+        help="publish pet state to a shared memory segment for viewers",
+    )
+    parser.add_argument(
+        "--view",
+        metavar="NAME",
+        help="attach read-only to a pet shared by another process",
+    )
+    return parser.parse_args()
+
+
+def view(name: str) -> None:
+    """
+    Render a pet owned by another process.
+    """
+    try:
+        viewer = SharedStateViewer(name)
+    except FileNotFoundError:
+        sys.exit(f"No shared pet named {name!r} (start one with --share {name}).")
+    except ValueError as error:
+        sys.exit(str(error))
+
+    if not viewer.running:
+        viewer.close()
+        sys.exit(f"The shared pet {name!r} is no longer running.")
+
+    try:
+        CursesUI(viewer).run()
+    finally:
+        viewer.close()
 
 
 def main() -> None:
@@ -42,6 +82,12 @@ def main() -> None:
     Application entry point.
     Responsible only for wiring components together.
     """
+    args = parse_args()
+
+    if args.view:
+        view(args.view)
+        return
+
     pet = create_pet()
 
     # 1 real second = 1 in-game minute
@@ -50,10 +96,25 @@ def main() -> None:
         minutes_per_real_second=1.0
     )
 
+    if args.share:
+        try:
+            engine.share(args.share)
+        except FileExistsError:
+            sys.exit(
+                f"A shared pet named {args.share!r} already exists. "
+                "Pick another name or close the other instance."
+            )
+
     ui = CursesUI(engine)
 
-    start_engine(engine)
-    ui.run()
+    engine_thread = start_engine(engine)
+    try:
+        ui.run()
+    finally:
+        # Let the engine finish its iteration before releasing shared memory
+        engine.running = False
+        engine_thread.join(timeout=1.0)
+        engine.stop_sharing()
 
 
 # -----------------------------
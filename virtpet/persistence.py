@@ -18,7 +18,7 @@ SAVE_FILE: Path = Path("pet_save.json")
 # Public Persistence API
 # -----------------------------
 
-def save_pet(pet: Pet) -> None:
+def save_pet(pet: Pet, path: Optional[Path] = None) -> None:
     """
     Persist the current pet state to disk.
 
@@ -26,21 +26,26 @@ def save_pet(pet: Pet) -> None:
     - It trusts Pet.to_dict() for structure
     - It always overwrites the save file
     - It does not handle versioning (yet)
+
+    :param path: Save file location (defaults to SAVE_FILE)
     """
-    with SAVE_FILE.open("w", encoding="utf-8") as file:
+    path = path or SAVE_FILE
+    with path.open("w", encoding="utf-8") as file:
         json.dump(pet.to_dict(), file, indent=2)
 
 
-def load_pet() -> Optional[Pet]:
+def load_pet(path: Optional[Path] = None) -> Optional[Pet]:
     """
     Load a pet from disk if a save file exists.
 
+    :param path: Save file location (defaults to SAVE_FILE)
     :return: Pet instance if found, otherwise None
     """
-    if not SAVE_FILE.exists():
+    path = path or SAVE_FILE
+    if not path.exists():
         return None
 
-    with SAVE_FILE.open("r", encoding="utf-8") as file:
+    with path.open("r", encoding="utf-8") as file:
         data = json.load(file)
 
     # Delegate reconstruction to the Pet class
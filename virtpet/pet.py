@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Optional
 
 
 class PetState(Enum):
@@ -23,6 +24,17 @@ class Pet:
     This class is UI-agnostic and engine-agnostic.
     """
 
+    # -----------------------------
+    # Tick Rules
+    # -----------------------------
+
+    HUNGER_INTERVAL = 30  # hunger increases every 30 minutes
+    TOILET_INTERVAL = 120  # toilet increases every 120 minutes
+    HAPPINESS_INTERVAL = 60  # passive happiness decay every 60 minutes
+
+    # Hunger or toilet at or above this level makes happiness decay faster
+    CRITICAL_NEED = 80
+
     # -----------------------------
     # Construction & Identity
     # -----------------------------
@@ -68,9 +80,10 @@ class Pet:
         - This is the ONLY place where passive changes occur
         - UI and engine must call this, never mutate needs directly
         """
-        HUNGER_INTERVAL = 30  # hunger increases every 30 minutes
-        TOILET_INTERVAL = 120  # toilet increases every 120 minutes
-        HAPPINESS_INTERVAL = 60  # passive happiness decay every 60 minutes
+        HUNGER_INTERVAL = self.HUNGER_INTERVAL
+        TOILET_INTERVAL = self.TOILET_INTERVAL
+        HAPPINESS_INTERVAL = self.HAPPINESS_INTERVAL
+        CRITICAL_NEED = self.CRITICAL_NEED
 
         # Paused freezes time entirely, regardless of activity
         if self.paused:
@@ -79,39 +92,122 @@ class Pet:
         if self.state == PetState.SLEEPING:
             return  # sleep blocks everything
 
-        for _ in range(minutes):
-            self.age += 1
-            self._hunger_timer += 1
-            self._toilet_timer += 1
-            self._happiness_timer += 1
-
-            # -------------------------
-            # Passive need progression
-            # -------------------------
+        if minutes <= 0:
+            return
 
-            # Hunger and toilet increase over time
-            # NOTE: In future sleep-by-clock mode, the engine may
-            # skip calling tick() while sleeping.
-            if self._hunger_timer >= HUNGER_INTERVAL:
-                self.hunger = min(100, self.hunger + 1)
-                self._hunger_timer = 0
+        # Time is advanced in closed form rather than minute by minute,
+        # so long waits cost one step per happiness interval at most.
+        # The result is identical to ticking one minute at a time.
+        hunger, hunger_timer = self.hunger, self._hunger_timer
+        toilet, toilet_timer = self.toilet, self._toilet_timer
+
+        # -------------------------
+        # Happiness decay
+        # -------------------------
+
+        # Base emotional entropy (temporary tuning).
+        # Decay happens each time the happiness timer fills; the rate
+        # depends on the needs at that exact minute.
+        first_decay = HAPPINESS_INTERVAL - self._happiness_timer
+        for elapsed in range(first_decay, minutes + 1, HAPPINESS_INTERVAL):
+            if self.happiness == 0:
+                break
+
+            if (
+                self._need_after(hunger, hunger_timer, HUNGER_INTERVAL, elapsed) >= CRITICAL_NEED
+                or self._need_after(toilet, toilet_timer, TOILET_INTERVAL, elapsed) >= CRITICAL_NEED
+            ):
+                self.happiness = max(0, self.happiness - 5)
+            else:
+                self.happiness = max(0, self.happiness - 1)
+
+        # -------------------------
+        # Passive need progression
+        # -------------------------
+
+        # Hunger and toilet increase over time
+        # NOTE: In future sleep-by-clock mode, the engine may
+        # skip calling tick() while sleeping.
+        self.hunger = self._need_after(hunger, hunger_timer, HUNGER_INTERVAL, minutes)
+        self.toilet = self._need_after(toilet, toilet_timer, TOILET_INTERVAL, minutes)
+
+        self._hunger_timer = (hunger_timer + minutes) % HUNGER_INTERVAL
+        self._toilet_timer = (toilet_timer + minutes) % TOILET_INTERVAL
+        self._happiness_timer = (self._happiness_timer + minutes) % HAPPINESS_INTERVAL
+        self.age += minutes
 
-            if self._toilet_timer >= TOILET_INTERVAL:
-                self.toilet = min(100, self.toilet + 1)
-                self._toilet_timer = 0
+    # -----------------------------
+    # Prediction
+    # -----------------------------
 
-            # -------------------------
-            # Happiness decay
-            # -------------------------
+    def minutes_until(self, stat: str, threshold: int) -> Optional[int]:
+        """
+        Predict how many ticked minutes until a need crosses a threshold,
+        assuming no player actions in between.
 
-            # Base emotional entropy (temporary tuning)
-            if self._happiness_timer >= HAPPINESS_INTERVAL:
-                if self.hunger >= 80 or self.toilet >= 80:
-                    self.happiness = max(0, self.happiness - 5)
-                else:
-                    self.happiness = max(0, self.happiness - 1)
+        Only the direction passive time moves a stat is supported:
+        - "hunger" / "toilet": minutes until the value is >= threshold
+        - "happiness": minutes until the value is <= threshold
 
-                self._happiness_timer = 0
+        :return: 0 if already met, None if tick() never gets there
+        """
+        if stat == "hunger":
+            return self._minutes_until_need(
+                self.hunger, self._hunger_timer, self.HUNGER_INTERVAL, threshold
+            )
+        if stat == "toilet":
+            return self._minutes_until_need(
+                self.toilet, self._toilet_timer, self.TOILET_INTERVAL, threshold
+            )
+        if stat == "happiness":
+            return self._minutes_until_unhappy(threshold)
+
+        raise ValueError(f"Cannot predict stat: {stat!r}")
+
+    @staticmethod
+    def _need_after(value: int, timer: int, interval: int, minutes: int) -> int:
+        """
+        Value of a rising need after a number of ticked minutes.
+        """
+        return min(100, value + (timer + minutes) // interval)
+
+    @staticmethod
+    def _minutes_until_need(value: int, timer: int, interval: int, threshold: int) -> Optional[int]:
+        if value >= threshold:
+            return 0
+        if threshold > 100:
+            return None
+
+        # First step lands when the timer fills, then one step per interval
+        steps = threshold - value
+        return (interval - timer) + (steps - 1) * interval
+
+    def _minutes_until_unhappy(self, threshold: int) -> Optional[int]:
+        happiness = self.happiness
+        if happiness <= threshold:
+            return 0
+        if threshold < 0:
+            return None
+
+        # Walk the hourly decay events; at most ~100 of them
+        minutes = self.HAPPINESS_INTERVAL - self._happiness_timer
+        while True:
+            hunger = self._need_after(
+                self.hunger, self._hunger_timer, self.HUNGER_INTERVAL, minutes
+            )
+            toilet = self._need_after(
+                self.toilet, self._toilet_timer, self.TOILET_INTERVAL, minutes
+            )
+
+            if hunger >= self.CRITICAL_NEED or toilet >= self.CRITICAL_NEED:
+                happiness = max(0, happiness - 5)
+            else:
+                happiness = max(0, happiness - 1)
+
+            if happiness <= threshold:
+                return minutes
+
+            minutes += self.HAPPINESS_INTERVAL
 
     # -----------------------------
     # Player Actions
@@ -172,6 +268,42 @@ class Pet:
             "paused": self.paused,
         }
 
+    def snapshot(self) -> tuple:
+        """
+        Capture the full simulation state as a compact immutable tuple.
+
+        Unlike to_dict(), this includes the internal timers, so
+        restoring a snapshot resumes ticking at exactly the same point.
+        Identity (name) is not included.
+        """
+        return (
+            self.age,
+            self.hunger,
+            self.happiness,
+            self.toilet,
+            self._hunger_timer,
+            self._toilet_timer,
+            self._happiness_timer,
+            self.state,
+            self.paused,
+        )
+
+    def restore(self, snapshot: tuple) -> None:
+        """
+        Restore state captured by snapshot().
+        """
+        (
+            self.age,
+            self.hunger,
+            self.happiness,
+            self.toilet,
+            self._hunger_timer,
+            self._toilet_timer,
+            self._happiness_timer,
+            self.state,
+            self.paused,
+        ) = snapshot
+
     @classmethod
     def from_dict(cls, data: dict) -> "Pet":
         """
@@ -0,0 +1,305 @@
+import os
+import socket
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import Iterable, Optional
+
+from virtpet.pet import Pet, PetState
+from virtpet.engine import GameEngine
+
+
+# -----------------------------
+# Segment Layout
+# -----------------------------
+#
+# Header (written once, except for `closed`):
+#   magic, layout version, command port, closed flag
+# Sequence counter (seqlock):
+#   odd while the engine is writing, even when the payload is stable
+# Heartbeat:
+#   wall-clock time of the last publish() call, written even when the
+#   payload is unchanged, so viewers notice an owner that died
+# Payload:
+#   pet stats, pet name, recent events
+
+MAGIC = b"VPET"
+LAYOUT_VERSION = 2
+
+NAME_BYTES = 64
+EVENT_BYTES = 120
+EVENT_SLOTS = 5
+
+_HEADER = struct.Struct("<4sHHB")
+_SEQ = struct.Struct("<Q")
+_HEARTBEAT = struct.Struct("<d")
+_PAYLOAD = struct.Struct(
+    f"<qhhhBBB{NAME_BYTES}s" + f"{EVENT_BYTES}s" * EVENT_SLOTS
+)
+
+_CLOSED_OFFSET = 8
+_SEQ_OFFSET = 16
+_HEARTBEAT_OFFSET = _SEQ_OFFSET + _SEQ.size
+_PAYLOAD_OFFSET = _HEARTBEAT_OFFSET + _HEARTBEAT.size
+SEGMENT_SIZE = _PAYLOAD_OFFSET + _PAYLOAD.size
+
+# Commands viewers may send back to the engine
+COMMANDS = ("feed", "play", "flush", "sleep", "pause")
+
+# Seconds without a heartbeat before viewers consider the owner gone
+STALE_AFTER: float = 2.0
+
+# Segments created by publishers in this process
+_published: set[str] = set()
+
+
+def _encode(text: str, size: int) -> bytes:
+    return text.encode("utf-8")[:size]
+
+
+def _decode(raw: bytes) -> str:
+    # Truncation may split a multi-byte character; drop the fragment
+    return raw.rstrip(b"\0").decode("utf-8", errors="ignore")
+
+
+# -----------------------------
+# Engine Side
+# -----------------------------
+
+class SharedStatePublisher:
+    """
+    Publishes pet state into a shared memory segment.
+
+    The engine writes once per change; any number of viewers map the
+    same segment and read it directly, so fan-out costs the engine
+    nothing per viewer.
+
+    Commands come back as tiny UDP datagrams on localhost. The port
+    is stored in the segment header so viewers only need the name.
+    """
+
+    def __init__(self, name: str):
+        """
+        :raises FileExistsError: If a segment with this name already exists
+        """
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=SEGMENT_SIZE)
+        self._buf = self._shm.buf
+
+        try:
+            self._commands = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._commands.bind(("127.0.0.1", 0))
+            self._commands.setblocking(False)
+        except OSError:
+            self._buf = None
+            self._shm.close()
+            self._shm.unlink()
+            raise
+        port = self._commands.getsockname()[1]
+        _published.add(self._shm._name)
+
+        _HEADER.pack_into(self._buf, 0, MAGIC, LAYOUT_VERSION, port, 0)
+        _SEQ.pack_into(self._buf, _SEQ_OFFSET, 0)
+        _HEARTBEAT.pack_into(self._buf, _HEARTBEAT_OFFSET, time.time())
+
+        self._seq: int = 0
+        self._last_payload: Optional[bytes] = None
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def publish(self, pet: Pet, events: Iterable[str]) -> None:
+        """
+        Write the current state. Skipped entirely if nothing changed,
+        so idle viewers never see the sequence counter move; only the
+        heartbeat is refreshed.
+        """
+        _HEARTBEAT.pack_into(self._buf, _HEARTBEAT_OFFSET, time.time())
+
+        event_list = list(events)[-EVENT_SLOTS:]
+        event_list += [""] * (EVENT_SLOTS - len(event_list))
+
+        payload = _PAYLOAD.pack(
+            pet.age,
+            pet.hunger,
+            pet.happiness,
+            pet.toilet,
+            pet.state == PetState.SLEEPING,
+            pet.paused,
+            len([e for e in event_list if e]),
+            _encode(pet.name, NAME_BYTES),
+            *(_encode(e, EVENT_BYTES) for e in event_list),
+        )
+
+        if payload == self._last_payload:
+            return
+        self._last_payload = payload
+
+        # Seqlock write: odd → payload → even
+        self._seq += 1
+        _SEQ.pack_into(self._buf, _SEQ_OFFSET, self._seq)
+        self._buf[_PAYLOAD_OFFSET:SEGMENT_SIZE] = payload
+        self._seq += 1
+        _SEQ.pack_into(self._buf, _SEQ_OFFSET, self._seq)
+
+    def poll_commands(self) -> list[str]:
+        """
+        Drain pending viewer commands without blocking.
+        Unknown commands are dropped.
+        """
+        commands: list[str] = []
+        while True:
+            try:
+                data = self._commands.recv(64)
+            except (BlockingIOError, InterruptedError):
+                return commands
+
+            command = data.decode("ascii", errors="ignore")
+            if command in COMMANDS:
+                commands.append(command)
+
+    def close(self) -> None:
+        """
+        Mark the segment closed for viewers, then release it.
+        """
+        self._buf[_CLOSED_OFFSET] = 1
+        self._commands.close()
+        self._buf = None
+        _published.discard(self._shm._name)
+        self._shm.close()
+        self._shm.unlink()
+
+
+# -----------------------------
+# Viewer Side
+# -----------------------------
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing segment without taking ownership of it.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: attaching registers the segment with the resource
+        # tracker, which would unlink it when this viewer exits. A publisher
+        # in this process shares the registration and still needs it.
+        shm = shared_memory.SharedMemory(name=name)
+        if os.name == "posix" and shm._name not in _published:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+class SharedStateViewer:
+    """
+    Read-only stand-in for GameEngine, backed by a shared memory segment.
+
+    Exposes the subset of the engine interface CursesUI uses, so a second
+    terminal can render the same pet without touching the save file.
+    Actions are forwarded to the owning engine.
+    """
+
+    def __init__(self, name: str):
+        self._shm = _attach(name)
+        self._buf = self._shm.buf
+
+        magic, version, port, _ = _HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC or version != LAYOUT_VERSION:
+            self._shm.close()
+            raise ValueError(f"Shared segment {name!r} is not a virt-pet state segment")
+
+        self._engine_address = ("127.0.0.1", port)
+        self._commands = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+        # Local snapshot, updated in place so UI references stay valid
+        self.pet: Pet = Pet("")
+        self.events: list[str] = []
+        self.running: bool = True
+
+        self._seen_seq: int = -1
+        self.sync()
+
+    # -----------------------------
+    # Reading
+    # -----------------------------
+
+    def sync(self) -> None:
+        """
+        Refresh the local snapshot if the engine published a new state.
+        Stops the viewer if the owner closed the segment or stopped
+        publishing (crashed or was killed).
+        """
+        if self._buf[_CLOSED_OFFSET]:
+            self.running = False
+            return
+
+        (heartbeat,) = _HEARTBEAT.unpack_from(self._buf, _HEARTBEAT_OFFSET)
+        if time.time() - heartbeat > STALE_AFTER:
+            self.running = False
+            return
+
+        while True:
+            (before,) = _SEQ.unpack_from(self._buf, _SEQ_OFFSET)
+            if before == self._seen_seq:
+                return
+            if before % 2:
+                continue  # writer in progress
+
+            payload = bytes(self._buf[_PAYLOAD_OFFSET:SEGMENT_SIZE])
+
+            (after,) = _SEQ.unpack_from(self._buf, _SEQ_OFFSET)
+            if before == after:
+                break
+
+        self._seen_seq = before
+        (
+            age, hunger, happiness, toilet, sleeping, paused, event_count, name,
+            *events,
+        ) = _PAYLOAD.unpack(payload)
+
+        pet = self.pet
+        pet.name = _decode(name)
+        pet.age = age
+        pet.hunger = hunger
+        pet.happiness = happiness
+        pet.toilet = toilet
+        pet.state = PetState.SLEEPING if sleeping else PetState.IDLE
+        pet.paused = bool(paused)
+
+        self.events = [_decode(e) for e in events[:event_count]]
+
+    # -----------------------------
+    # Engine-compatible interface
+    # -----------------------------
+
+    def _send(self, command: str) -> None:
+        self._commands.sendto(command.encode("ascii"), self._engine_address)
+
+    def feed(self) -> None:
+        self._send("feed")
+
+    def play(self) -> None:
+        self._send("play")
+
+    def flush(self) -> None:
+        self._send("flush")
+
+    def toggle_sleep(self) -> None:
+        self._send("sleep")
+
+    def toggle_pause(self) -> None:
+        self._send("pause")
+
+    @staticmethod
+    def get_local_time() -> str:
+        return GameEngine.get_local_time()
+
+    @staticmethod
+    def get_time_to_next_sleep_transition() -> str:
+        return GameEngine.get_time_to_next_sleep_transition()
+
+    def close(self) -> None:
+        self._commands.close()
+        self._buf = None
+        self._shm.close()
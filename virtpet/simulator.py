@@ -0,0 +1,377 @@
+import argparse
+import random
+import re
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from os import cpu_count
+from typing import Optional, Union
+
+from virtpet.pet import Pet, PetState
+from virtpet.engine import GameEngine
+
+
+# -----------------------------
+# Simulation Configuration
+# -----------------------------
+
+MINUTES_PER_DAY: int = 24 * 60
+
+# A need at or above this level is considered critical
+CRITICAL_NEED: int = Pet.CRITICAL_NEED
+
+
+# -----------------------------
+# Care Policies
+# -----------------------------
+
+@dataclass(frozen=True)
+class CarePolicy:
+    """
+    A scripted player.
+
+    Thresholds are checked while the pet is awake. When a rule triggers,
+    the simulated player reacts after a random delay of up to
+    ``reaction_jitter`` minutes, like a real person glancing at the screen.
+
+    A rule set to None is never applied.
+    """
+
+    name: str = "default"
+
+    # Feed when hunger is strictly above this value
+    feed_above_hunger: Optional[int] = 60
+
+    # Flush when toilet reaches this value
+    flush_at_toilet: Optional[int] = 40
+
+    # Play on a fixed schedule (in-game minutes)
+    play_every_minutes: Optional[int] = 180
+
+    # Maximum player reaction delay / schedule drift (in-game minutes)
+    reaction_jitter: int = 15
+
+    def __post_init__(self):
+        if self.reaction_jitter < 0:
+            raise ValueError(
+                f"reaction_jitter must not be negative (got {self.reaction_jitter})"
+            )
+
+    @classmethod
+    def parse(cls, spec: str, reaction_jitter: int = 15) -> "CarePolicy":
+        """
+        Build a policy from a short comma-separated script, e.g.:
+
+            "feed when hunger > 60, flush at toilet 40, play every 3h"
+
+        Rules that are not mentioned are disabled.
+        """
+        feed = flush = play = None
+
+        for clause in filter(None, (c.strip().lower() for c in spec.split(","))):
+            if match := re.fullmatch(r"feed when hunger\s*>\s*(\d+)", clause):
+                feed = int(match.group(1))
+            elif match := re.fullmatch(r"flush at toilet\s*(\d+)", clause):
+                flush = int(match.group(1))
+            elif match := re.fullmatch(r"play every\s*(\d+)\s*([hm]?)", clause):
+                amount, unit = int(match.group(1)), match.group(2)
+                play = amount * 60 if unit == "h" else amount
+            else:
+                raise ValueError(f"Unknown care rule: {clause!r}")
+
+        return cls(
+            name=spec,
+            feed_above_hunger=feed,
+            flush_at_toilet=flush,
+            play_every_minutes=play,
+            reaction_jitter=reaction_jitter,
+        )
+
+
+# -----------------------------
+# Results
+# -----------------------------
+
+@dataclass
+class LifetimeOutcome:
+    """
+    Summary of a single simulated lifetime.
+    """
+
+    final_happiness: int
+    mean_happiness: float
+    min_happiness: int
+
+    # In-game minutes spent with a critical need (awake or asleep)
+    hungry_minutes: int
+    dirty_minutes: int
+
+    feeds: int
+    flushes: int
+    plays: int
+
+
+@dataclass
+class SimulationReport:
+    """
+    Aggregated outcome distribution for one policy.
+    """
+
+    policy: CarePolicy
+    days: int
+    outcomes: list[LifetimeOutcome] = field(repr=False)
+
+    @property
+    def lifetimes(self) -> int:
+        return len(self.outcomes)
+
+    def percentiles(self, metric: str) -> dict[int, float]:
+        """
+        Return the 10th/25th/50th/75th/90th percentiles of a
+        LifetimeOutcome attribute across all lifetimes.
+        """
+        values = [getattr(outcome, metric) for outcome in self.outcomes]
+        if len(values) == 1:
+            return {p: float(values[0]) for p in (10, 25, 50, 75, 90)}
+
+        cuts = statistics.quantiles(values, n=20, method="inclusive")
+        return {10: cuts[1], 25: cuts[4], 50: cuts[9], 75: cuts[14], 90: cuts[17]}
+
+    def mean(self, metric: str) -> float:
+        return statistics.fmean(getattr(o, metric) for o in self.outcomes)
+
+    def format(self) -> str:
+        """
+        Render a small plain-text report.
+        """
+        lifetime_minutes = self.days * MINUTES_PER_DAY
+        lines = [
+            f"Policy: {self.policy.name}",
+            f"Lifetimes: {self.lifetimes} x {self.days} day(s)",
+        ]
+
+        for metric in ("mean_happiness", "final_happiness", "min_happiness"):
+            p = self.percentiles(metric)
+            lines.append(
+                f"  {metric:<16} p10 {p[10]:5.1f}  p50 {p[50]:5.1f}  p90 {p[90]:5.1f}"
+            )
+
+        for metric in ("hungry_minutes", "dirty_minutes"):
+            p = self.percentiles(metric)
+            share = self.mean(metric) / lifetime_minutes * 100
+            lines.append(
+                f"  {metric:<16} p50 {p[50]:7.0f}  p90 {p[90]:7.0f}  "
+                f"({share:.1f}% of lifetime on average)"
+            )
+
+        lines.append(
+            f"  actions/lifetime feed {self.mean('feeds'):.1f}  "
+            f"flush {self.mean('flushes'):.1f}  play {self.mean('plays'):.1f}"
+        )
+        return "\n".join(lines)
+
+
+# -----------------------------
+# Single Lifetime
+# -----------------------------
+
+def simulate_lifetime(
+    policy: CarePolicy,
+    days: int,
+    seed: Union[int, str],
+    start_hour: int = 8,
+    step_minutes: int = 5,
+) -> LifetimeOutcome:
+    """
+    Simulate one pet lifetime under a care policy.
+
+    Uses the real Pet rules and the engine's sleep window. The clock
+    advances in steps of ``step_minutes`` while awake (the player can
+    only react at step boundaries) and jumps straight to wake-up while
+    asleep, since Pet.tick does nothing during sleep.
+    """
+    rng = random.Random(seed)
+    pet = Pet("sim")
+
+    sleep_start = GameEngine.SLEEP_START_HOUR * 60
+    sleep_end = GameEngine.SLEEP_END_HOUR * 60
+    jitter = policy.reaction_jitter
+
+    clock = start_hour * 60
+    end = clock + days * MINUTES_PER_DAY
+
+    feed_due: Optional[int] = None
+    flush_due: Optional[int] = None
+    next_play: Optional[int] = None
+    if policy.play_every_minutes is not None:
+        next_play = clock + policy.play_every_minutes
+
+    happiness_area = 0
+    min_happiness = pet.happiness
+    hungry_minutes = dirty_minutes = 0
+    feeds = flushes = plays = 0
+
+    while clock < end:
+        minute_of_day = clock % MINUTES_PER_DAY
+
+        if GameEngine.is_sleep_hour(minute_of_day // 60):
+            if pet.state != PetState.SLEEPING:
+                pet.sleep()
+            span = min((sleep_end - minute_of_day) % MINUTES_PER_DAY, end - clock)
+        else:
+            if pet.state == PetState.SLEEPING:
+                pet.sleep()
+
+            # -------------------------
+            # Scripted player
+            # -------------------------
+
+            if policy.feed_above_hunger is not None and pet.hunger > policy.feed_above_hunger:
+                if feed_due is None:
+                    feed_due = clock + rng.randint(0, jitter)
+                if clock >= feed_due:
+                    pet.feed()
+                    feeds += 1
+                    feed_due = None
+            else:
+                feed_due = None
+
+            if policy.flush_at_toilet is not None and pet.toilet >= policy.flush_at_toilet:
+                if flush_due is None:
+                    flush_due = clock + rng.randint(0, jitter)
+                if clock >= flush_due:
+                    pet.flush()
+                    flushes += 1
+                    flush_due = None
+            else:
+                flush_due = None
+
+            if next_play is not None and clock >= next_play:
+                pet.play()
+                plays += 1
+                drift = rng.randint(-jitter, jitter)
+                next_play = clock + max(1, policy.play_every_minutes + drift)
+
+            span = min(step_minutes, sleep_start - minute_of_day, end - clock)
+            pet.tick(span)
+
+        clock += span
+
+        # Account the step using the state at its end
+        happiness_area += pet.happiness * span
+        min_happiness = min(min_happiness, pet.happiness)
+        if pet.hunger >= CRITICAL_NEED:
+            hungry_minutes += span
+        if pet.toilet >= CRITICAL_NEED:
+            dirty_minutes += span
+
+    return LifetimeOutcome(
+        final_happiness=pet.happiness,
+        mean_happiness=happiness_area / (days * MINUTES_PER_DAY),
+        min_happiness=min_happiness,
+        hungry_minutes=hungry_minutes,
+        dirty_minutes=dirty_minutes,
+        feeds=feeds,
+        flushes=flushes,
+        plays=plays,
+    )
+
+
+def _simulate_chunk(
+    policy: CarePolicy, days: int, seed: int, indices: range
+) -> list[LifetimeOutcome]:
+    """
+    Worker entry point: simulate a contiguous block of lifetimes.
+    Chunking keeps inter-process traffic to one round-trip per block.
+
+    Each lifetime is seeded from (seed, index), so runs with different
+    seeds never share samples whatever their size.
+    """
+    return [simulate_lifetime(policy, days, f"{seed}:{index}") for index in indices]
+
+
+# -----------------------------
+# Public Simulation API
+# -----------------------------
+
+def run_simulation(
+    policy: CarePolicy,
+    lifetimes: int = 1000,
+    days: int = 7,
+    seed: int = 0,
+    workers: Optional[int] = None,
+) -> SimulationReport:
+    """
+    Run many independent lifetimes across a process pool.
+
+    Results are reproducible for a given seed regardless of the
+    number of workers.
+
+    :param workers: Process count (defaults to CPU count, 1 = in-process)
+    """
+    if lifetimes < 1:
+        raise ValueError(f"lifetimes must be at least 1 (got {lifetimes})")
+    if days < 1:
+        raise ValueError(f"days must be at least 1 (got {days})")
+
+    workers = workers or cpu_count() or 1
+
+    if workers == 1:
+        outcomes = _simulate_chunk(policy, days, seed, range(lifetimes))
+        return SimulationReport(policy, days, outcomes)
+
+    # A few chunks per worker smooths out uneven lifetimes
+    chunk_size = max(1, -(-lifetimes // (workers * 4)))
+    chunks = [
+        range(start, min(start + chunk_size, lifetimes))
+        for start in range(0, lifetimes, chunk_size)
+    ]
+
+    outcomes: list[LifetimeOutcome] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in pool.map(
+            _simulate_chunk,
+            [policy] * len(chunks),
+            [days] * len(chunks),
+            [seed] * len(chunks),
+            chunks,
+        ):
+            outcomes.extend(chunk)
+
+    return SimulationReport(policy, days, outcomes)
+
+
+# -----------------------------
+# Command Line
+# -----------------------------
+
+def main() -> None:
+    """
+    Compare one or more care policies from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Monte Carlo care-policy simulator")
+    parser.add_argument(
+        "policies",
+        nargs="*",
+        default=["feed when hunger > 60, flush at toilet 40, play every 3h"],
+        help='e.g. "feed when hunger > 60, flush at toilet 40, play every 3h"',
+    )
+    parser.add_argument("--lifetimes", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--jitter", type=int, default=15, help="max reaction delay (minutes)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    for spec in args.policies:
+        try:
+            policy = CarePolicy.parse(spec, reaction_jitter=args.jitter)
+            report = run_simulation(policy, args.lifetimes, args.days, args.seed, args.workers)
+        except ValueError as error:
+            parser.error(str(error))
+        print(report.format())
+        print()
+
+
+if __name__ == "__main__":
+    main()
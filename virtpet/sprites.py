@@ -0,0 +1,179 @@
+import unicodedata
+from typing import Optional, Union
+
+
+# -----------------------------
+# Default Sprites
+# -----------------------------
+
+# State name -> animation frames.
+# A frame is a single line or a list of lines (multi-line sprite).
+DEFAULT_SPRITES: dict[str, list[Union[str, list[str]]]] = {
+    "idle": ["🐣", "🐥"],
+    "sleeping": ["😴 Sleeping.", "😴 Sleeping..", "😴 Sleeping..."],
+    "paused": ["⏸️ Paused"],
+    "poop": ["💩"],
+}
+
+# UI frames each animation frame stays on screen (~100ms per UI frame)
+DEFAULT_FRAME_TICKS: int = 5
+
+
+# -----------------------------
+# Terminal Cell Width
+# -----------------------------
+
+def cell_width(text: str) -> int:
+    """
+    Number of terminal cells a string occupies.
+
+    Wide (East Asian / emoji) characters take two cells; combining
+    marks, zero-width joiners and variation selectors take none.
+    An emoji variation selector (U+FE0F) widens the preceding character.
+    """
+    width = 0
+    previous = 0
+
+    for char in text:
+        if char == "\ufe0f":
+            # Emoji presentation: render the previous character wide
+            width += 2 - previous
+            previous = 2
+            continue
+
+        if char == "\ufe0e" or unicodedata.combining(char) or unicodedata.category(char) == "Cf":
+            # Text presentation selector, combining marks, ZWJ and other format chars
+            continue
+
+        previous = 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+        width += previous
+
+    return width
+
+
+# -----------------------------
+# Sprites
+# -----------------------------
+
+class Sprite:
+    """
+    A multi-frame sprite with pre-composed, ready-to-blit lines.
+
+    Every line of every frame is padded to the sprite's width so
+    frames fully overwrite each other and callers can bounce the
+    sprite off screen edges using a single known width.
+    """
+
+    def __init__(self, frames: list[Union[str, list[str]]], frame_ticks: int = DEFAULT_FRAME_TICKS):
+        if not frames:
+            raise ValueError("A sprite needs at least one frame")
+
+        raw = [[frame] if isinstance(frame, str) else list(frame) for frame in frames]
+
+        # Measure once; rendering never measures again
+        self.width: int = max(cell_width(line) for frame in raw for line in frame)
+        self.height: int = max(len(frame) for frame in raw)
+        self.frame_ticks: int = max(1, frame_ticks)
+
+        self.frames: tuple[tuple[str, ...], ...] = tuple(
+            tuple(
+                line + " " * (self.width - cell_width(line))
+                for line in frame + [""] * (self.height - len(frame))
+            )
+            for frame in raw
+        )
+
+    def frame(self, tick: int) -> tuple[str, ...]:
+        """
+        Lines of the animation frame shown at a given UI tick.
+        """
+        return self.frames[(tick // self.frame_ticks) % len(self.frames)]
+
+
+class SpriteAtlas:
+    """
+    All sprites used by the UI, loaded once at startup.
+    """
+
+    def __init__(
+        self,
+        sprites: Optional[dict[str, list[Union[str, list[str]]]]] = None,
+        frame_ticks: int = DEFAULT_FRAME_TICKS,
+    ):
+        sprites = DEFAULT_SPRITES if sprites is None else sprites
+        self._sprites: dict[str, Sprite] = {
+            name: Sprite(frames, frame_ticks) for name, frames in sprites.items()
+        }
+
+    def __getitem__(self, name: str) -> Sprite:
+        return self._sprites[name]
+
+
+# -----------------------------
+# Poop Grid
+# -----------------------------
+
+class PoopGrid:
+    """
+    Fixed-size row of poop slots.
+
+    Poops snap to slots one sprite wide, so repeated drops at the same
+    spot collapse into one cell. The rendered row is composed only when
+    the grid changes, so drawing costs one write per frame no matter
+    how long the pet goes unflushed.
+    """
+
+    def __init__(self, sprite: Sprite, screen_width: int):
+        self._sprite = sprite
+        self._line: str = sprite.frames[0][0]
+
+        # Leave the last column free; curses errors on writing it
+        self.screen_width: int = screen_width
+        self._cells = bytearray(max(0, screen_width - 1) // sprite.width)
+
+        # Poops dropped since the last flush (before deduplication)
+        self._dropped: int = 0
+        self._row: Optional[str] = None
+
+    def sync(self, expected: int, x: int) -> None:
+        """
+        Drop poops at column x until ``expected`` have been dropped.
+        A drop in expected (the toilet was flushed) clears the grid.
+        """
+        if expected < self._dropped:
+            self.clear()
+
+        if self._dropped >= expected:
+            return
+
+        slot = min(x // self._sprite.width, len(self._cells) - 1)
+        if slot >= 0 and not self._cells[slot]:
+            self._cells[slot] = 1
+            self._row = None
+        self._dropped = expected
+
+    def resize(self, screen_width: int) -> None:
+        """
+        Adapt to a new terminal width, keeping the poops that still fit.
+        """
+        slots = max(0, screen_width - 1) // self._sprite.width
+        cells = self._cells[:slots]
+        cells.extend(bytes(slots - len(cells)))
+
+        self.screen_width = screen_width
+        self._cells = cells
+        self._row = None
+
+    def clear(self) -> None:
+        self._cells = bytearray(len(self._cells))
+        self._dropped = 0
+        self._row = None
+
+    def row(self) -> str:
+        """
+        The composed poop row, starting at column 0.
+        """
+        if self._row is None:
+            blank = " " * self._sprite.width
+            self._row = "".join(self._line if cell else blank for cell in self._cells).rstrip()
+        return self._row
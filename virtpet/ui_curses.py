@@ -1,7 +1,9 @@
 import curses
+from typing import Optional
 
 from virtpet.pet import PetState
 from virtpet.engine import GameEngine
+from virtpet.sprites import PoopGrid, Sprite, SpriteAtlas
 
 
 class CursesUI:
@@ -19,12 +21,15 @@ class CursesUI:
     - Persistence
     """
 
+    # Row where the pet and its poops are drawn
+    PET_Y = 9
+
     # -----------------------------
     # Construction
     # -----------------------------
 
     def __init__(self, engine: GameEngine):
-        # Reference to the simulation engine
+        # Reference to the simulation engine (or a read-only viewer of one)
         self.engine: GameEngine = engine
 
         # Shortcut to the pet (read-only usage expected)
@@ -40,8 +45,14 @@ class CursesUI:
         # Horizontal movement direction (1 = right, -1 = left)
         self._pet_dir: int = 1
 
-        # UI-only poop positions (cosmetic)
-        self._poops: list[tuple[int, int]] = []
+        # Sprites are measured and pre-composed once
+        self._sprites: SpriteAtlas = SpriteAtlas()
+
+        # UI frame counter driving sprite animation
+        self._frame: int = 0
+
+        # UI-only poop positions (cosmetic), sized on first frame
+        self._poops: Optional[PoopGrid] = None
 
     # -----------------------------
     # Public API
@@ -69,6 +80,7 @@ class CursesUI:
 
         while self.engine.running:
             self._handle_input(stdscr)
+            self.engine.sync()
             self._draw_frame(stdscr)
 
     def _configure_curses(self, stdscr) -> None:
@@ -135,16 +147,19 @@ class CursesUI:
 
         Moves the pet horizontally while idle.
         """
+        self._frame += 1
+
         if self.pet.state != PetState.IDLE:
             return
 
         self._pet_x += self._pet_dir
 
+        max_x = screen_width - self._sprites["idle"].width
         if self._pet_x <= 0:
             self._pet_x = 0
             self._pet_dir = 1
-        elif self._pet_x >= screen_width - 2:
-            self._pet_x = screen_width - 2
+        elif self._pet_x >= max_x:
+            self._pet_x = max(0, max_x)
             self._pet_dir = -1
 
     # -----------------------------
@@ -163,7 +178,7 @@ class CursesUI:
         self._draw_header(stdscr)
         self._draw_time_info(stdscr)
         self._draw_stats(stdscr)
-        self._draw_poops(stdscr)
+        self._draw_poops(stdscr, width)
         self._draw_pet(stdscr)
         self._draw_log(stdscr)
         self._draw_footer(stdscr)
@@ -183,28 +198,37 @@ class CursesUI:
         stdscr.addstr(6, 0, f"Happiness:  {self.pet.happiness:3}")
         stdscr.addstr(7, 0, f"Toilet:     {self.pet.toilet:3}")
 
-    def _draw_poops(self, stdscr) -> None:
-        for y, x in self._poops:
-            stdscr.addstr(y, x, "💩")
+    def _draw_poops(self, stdscr, screen_width: int) -> None:
+        if self._poops is None:
+            self._poops = PoopGrid(self._sprites["poop"], screen_width)
+        elif self._poops.screen_width != screen_width:
+            self._poops.resize(screen_width)
 
-    def _clear_poop(self) -> None:
-        self._poops.clear()
+        # One poop per 20 toilet, dropped where the pet stands
+        self._poops.sync(self.pet.toilet // 20, self._pet_x)
 
-    def _draw_pet(self, stdscr) -> None:
-        pet_y = 9
+        row = self._poops.row()
+        if row:
+            stdscr.addstr(self.PET_Y, 0, row)
 
-        # Poop position
-        expected_poops = self.pet.toilet // 20
-        while len(self._poops) < expected_poops:
-            self._poops.append((pet_y, self._pet_x))
-        # Poop position
+    def _clear_poop(self) -> None:
+        if self._poops is not None:
+            self._poops.clear()
 
+    def _draw_pet(self, stdscr) -> None:
         if self.pet.paused:
-            stdscr.addstr(pet_y, 0, "⏸️ Paused")
+            self._blit(stdscr, self._sprites["paused"], 0)
         elif self.pet.state == PetState.SLEEPING:
-            stdscr.addstr(pet_y, 0, "😴 Sleeping...")
+            self._blit(stdscr, self._sprites["sleeping"], 0)
         else:
-            stdscr.addstr(pet_y, self._pet_x, "🐣")
+            self._blit(stdscr, self._sprites["idle"], self._pet_x)
+
+    def _blit(self, stdscr, sprite: Sprite, x: int) -> None:
+        """
+        Draw the current animation frame of a sprite at the pet row.
+        """
+        for i, line in enumerate(sprite.frame(self._frame)):
+            stdscr.addstr(self.PET_Y + i, x, line)
 
     def _draw_footer(self, stdscr) -> None:
         stdscr.addstr(
@@ -0,0 +1,182 @@
+import heapq
+import re
+import threading
+from typing import Callable, Optional
+
+from virtpet.pet import Pet
+
+
+# Conditions that passive time can make true.
+# Hunger and toilet only rise while ticking; happiness only falls.
+_RISING_STATS = ("hunger", "toilet")
+_FALLING_STATS = ("happiness",)
+
+_CONDITION_RE = re.compile(r"\s*(\w+)\s*(>=|<=|>|<)\s*(-?\d+)\s*")
+
+
+class Watcher:
+    """
+    A subscription to a pet condition such as "hunger >= 80".
+
+    Fires once when the condition becomes true, then stays quiet
+    until a player action makes it false again.
+    """
+
+    def __init__(self, condition: str, callback: Callable[["Watcher", Pet], None]):
+        match = _CONDITION_RE.fullmatch(condition)
+        if match is None:
+            raise ValueError(f"Invalid watch condition: {condition!r}")
+
+        stat, op, value = match.group(1), match.group(2), int(match.group(3))
+
+        # Normalize strict comparisons to inclusive thresholds
+        if op == ">":
+            op, value = ">=", value + 1
+        elif op == "<":
+            op, value = "<=", value - 1
+
+        if not (
+            (stat in _RISING_STATS and op == ">=")
+            or (stat in _FALLING_STATS and op == "<=")
+        ):
+            raise ValueError(
+                f"Unsupported watch condition: {condition!r} "
+                "(use hunger/toilet >= N or happiness <= N)"
+            )
+
+        self.condition: str = condition
+        self.stat: str = stat
+        self.threshold: int = value
+        self.callback = callback
+
+        # Whether the condition held when last evaluated
+        self.met: bool = False
+
+        # Pet age (ticked minutes) at which the condition is next met
+        self.due_age: Optional[int] = None
+
+    def is_met(self, pet: Pet) -> bool:
+        value = getattr(pet, self.stat)
+        if self.stat in _RISING_STATS:
+            return value >= self.threshold
+        return value <= self.threshold
+
+    def __repr__(self) -> str:
+        return f"Watcher({self.condition!r}, due_age={self.due_age})"
+
+
+class WatcherSet:
+    """
+    Schedule of watchers keyed by the pet age at which they fire.
+
+    Due ages are computed up front from the tick rules (Pet.minutes_until),
+    so the engine only compares the pet's age against the earliest due
+    age after ticking. Plans are rebuilt only when a player action changes
+    the pet's stats.
+    """
+
+    def __init__(self):
+        self._watchers: list[Watcher] = []
+
+        # Min-heap of (due_age, insertion order, watcher)
+        self._heap: list[tuple[int, int, Watcher]] = []
+        self._counter: int = 0
+
+        # The UI thread (actions) and engine thread (ticks) both touch the plan
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self._watchers)
+
+    # -----------------------------
+    # Subscription
+    # -----------------------------
+
+    def add(self, watcher: Watcher, pet: Pet) -> None:
+        with self._lock:
+            self._watchers.append(watcher)
+            fire = self._plan(watcher, pet)
+
+        if fire:
+            watcher.callback(watcher, pet)
+
+    def remove(self, watcher: Watcher) -> None:
+        with self._lock:
+            self._watchers.remove(watcher)
+            # Stale heap entries are skipped when popped
+            watcher.due_age = None
+
+    # -----------------------------
+    # Scheduling
+    # -----------------------------
+
+    def minutes_until_due(self, age: int) -> Optional[int]:
+        """
+        Ticked minutes from the given age until the next watcher fires.
+        """
+        with self._lock:
+            self._drop_stale()
+            if not self._heap:
+                return None
+            return self._heap[0][0] - age
+
+    def fire_due(self, pet: Pet) -> None:
+        """
+        Fire every watcher whose due age has been reached.
+        """
+        due: list[Watcher] = []
+
+        with self._lock:
+            self._drop_stale()
+            while self._heap and self._heap[0][0] <= pet.age:
+                _, _, watcher = heapq.heappop(self._heap)
+                watcher.due_age = None
+                watcher.met = True
+                due.append(watcher)
+                self._drop_stale()
+
+        # Callbacks run unlocked so they may trigger actions (and replans)
+        for watcher in due:
+            watcher.callback(watcher, pet)
+
+    def replan(self, pet: Pet) -> None:
+        """
+        Recompute every due age after the pet's stats changed.
+        Watchers whose condition became true fire immediately.
+        """
+        with self._lock:
+            self._heap.clear()
+            fired = [w for w in self._watchers if self._plan(w, pet)]
+
+        for watcher in fired:
+            watcher.callback(watcher, pet)
+
+    # -----------------------------
+    # Internal Helpers
+    # -----------------------------
+
+    def _plan(self, watcher: Watcher, pet: Pet) -> bool:
+        """
+        Schedule a watcher. Return True if it should fire right now.
+        Caller must hold the lock.
+        """
+        watcher.due_age = None
+
+        if watcher.is_met(pet):
+            newly_met = not watcher.met
+            watcher.met = True
+            return newly_met
+
+        watcher.met = False
+        minutes = pet.minutes_until(watcher.stat, watcher.threshold)
+        if minutes is not None:
+            watcher.due_age = pet.age + minutes
+            self._counter += 1
+            heapq.heappush(self._heap, (watcher.due_age, self._counter, watcher))
+
+        return False
+
+    def _drop_stale(self) -> None:
+        heap = self._heap
+        while heap and heap[0][2].due_age != heap[0][0]:
+            heapq.heappop(heap)